@@ -346,19 +346,22 @@ class DashModelAdaptor(dict):
                 all_x_vals = []
                 all_y_vals = []
                 data = []
+                # the None and nan points are masked out of whole arrays,
+                # rather than checked one point at a time
+                times = numpy.array(model.times, dtype=float)
                 for key in plot["vars"]:
                     x_vals = []
                     y_vals = []
                     if key in model.solution:
-                        for x, y in zip(model.times, model.solution[key]):
-                            if x is None or numpy.isnan(x):
-                                logger.info(f"make_stages_graphs_div error x={x}")
-                                continue
-                            if y is None or numpy.isnan(y):
-                                logger.info(f"make_stages_graphs_div error y={y}")
-                                continue
-                            x_vals.append(float(x))
-                            y_vals.append(float(y))
+                        y_array = numpy.array(model.solution[key], dtype=float)
+                        n_time = min(len(times), len(y_array))
+                        x_array, y_array = times[:n_time], y_array[:n_time]
+                        is_valid = ~(numpy.isnan(x_array) | numpy.isnan(y_array))
+                        if not numpy.all(is_valid):
+                            n_skip = n_time - numpy.count_nonzero(is_valid)
+                            logger.info(f"make_figures skip {n_skip} nan of {key}")
+                        x_vals = x_array[is_valid].tolist()
+                        y_vals = y_array[is_valid].tolist()
                     all_x_vals.extend(x_vals)
                     all_y_vals.extend(y_vals)
                     data.append(
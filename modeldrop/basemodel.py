@@ -1,10 +1,15 @@
 import logging
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 __doc__ = """
 """
 
-from scipy.integrate import odeint
+import numpy
+from scipy.integrate import odeint, solve_ivp
+
+logger = logging.getLogger(__name__)
 
 
 class AttrDict(dict):
@@ -36,6 +41,10 @@ class BaseModel:
         self.fn = AttrDict()
 
         self.integrate_method = "scipy_odeint_integrate"
+        self.solve_ivp_method = "LSODA"
+        # set in models whose calc_aux_vars and calc_diagnostic_aux_vars
+        # work on arrays, to calculate the aux var solutions in one call
+        self.is_array_aux_vars = False
         self.param.time = 100
         self.param.dt = 1
         self.times = None
@@ -63,6 +72,9 @@ class BaseModel:
     def calc_aux_vars(self):
         pass
 
+    def calc_diagnostic_aux_vars(self):
+        pass
+
     def reset_solutions(self):
         self.solution.clear()
 
@@ -87,6 +99,7 @@ class BaseModel:
     def check_consistency(self):
         self.init_vars()
         self.calc_aux_vars()
+        self.calc_diagnostic_aux_vars()
         self.calc_dvars(0)
 
         for v in self.var:
@@ -150,6 +163,31 @@ class BaseModel:
             if is_break:
                 break
 
+    def rk4_integrate(self):
+        """
+        Fixed-step classical Runge-Kutta in increments of self.param.dt,
+        which is 4th order accurate for 4 calls of calc_dvars a step,
+        rather than the 1st order of euler_integrate
+        """
+
+        def calc_dvar_array(var_array, t):
+            for v, key in zip(var_array, self.keys):
+                self.var[key] = v
+            self.calc_aux_vars()
+            self.calc_dvars(t)
+            return numpy.array([self.dvar[k] for k in self.keys], dtype=float)
+
+        y_init = numpy.array([self.var[key] for key in self.keys], dtype=float)
+        self.output = calc_rk4_output(
+            calc_dvar_array, y_init, self.times, self.param.dt
+        )
+        # the output stops at the first non-finite vars, as in
+        # scipy_solve_ivp_integrate, so self.times is cut to match
+        self.times = self.times[: len(self.output)]
+
+        for i, key in enumerate(self.keys):
+            self.solution[key] = self.output[:, i]
+
     def scipy_odeint_integrate(self):
         def calc_dvar_array(var_array, t):
             for v, key in zip(var_array, self.keys):
@@ -167,23 +205,73 @@ class BaseModel:
         for i, key in enumerate(self.keys):
             self.solution[key] = self.output[:, i]
 
+    def scipy_solve_ivp_integrate(self):
+        def calc_dvar_array(t, var_array):
+            for v, key in zip(var_array, self.keys):
+                self.var[key] = v
+            self.calc_aux_vars()
+            self.calc_dvars(t)
+            dvars = [self.dvar[k] for k in self.keys]
+            if not all(map(math.isfinite, dvars)):
+                # LSODA can stall at an infinite derivative without ever
+                # returning, whereas on nan it carries on to the end
+                return [math.nan] * len(dvars)
+            return dvars
+
+        y_init = [self.var[key] for key in self.keys]
+
+        result = solve_ivp(
+            calc_dvar_array,
+            (self.times[0], self.times[-1]),
+            y_init,
+            method=self.solve_ivp_method,
+            t_eval=self.times,
+            # match the default tolerances of odeint
+            rtol=1.49012e-8,
+            atol=1.49012e-8,
+        )
+        if not result.success:
+            logger.warning(f"solve_ivp {self.solve_ivp_method}: {result.message}")
+
+        # like euler_integrate and rk4_integrate, the solutions stop at
+        # a failure or the first non-finite vars, and self.times is cut
+        # to match, so the aux vars are calculated over just those times
+        n_time = len(result.t)
+        is_finite = numpy.all(numpy.isfinite(result.y), axis=0)
+        if not numpy.all(is_finite):
+            n_time = int(numpy.argmin(is_finite))
+            logger.warning(f"solve_ivp {self.solve_ivp_method}: vars not finite")
+        if n_time < len(self.times):
+            self.times = result.t[:n_time]
+
+        self.output = result.y.T[:n_time]
+
+        for i, key in enumerate(self.keys):
+            self.solution[key] = self.output[:, i]
+
     def run(self):
         self.reset_solutions()
         self.init_vars()
-        self.keys = list(self.var.keys())
+        self.keys = tuple(self.var.keys())
         self.check_consistency()
-        self.times = list(float_range(0, self.param.time, self.param.dt))
+        self.times = numpy.arange(0, self.param.time, self.param.dt)
 
-        if self.integrate_method == "scipy_odeint_integrate":
-            self.scipy_odeint_integrate()
-        elif self.integrate_method == "euler_integrate":
-            self.euler_integrate()
-        else:
+        # models can add their own integrators as *_integrate methods
+        integrate_fn = getattr(self, self.integrate_method, None)
+        if not self.integrate_method.endswith("_integrate") or integrate_fn is None:
             raise Exception(f"integrate_method {self.integrate_method} not recognized")
+        integrate_fn()
 
         self.calc_aux_var_solutions()
 
     def calc_aux_var_solutions(self):
+        n_time = len(self.times)
+        if self.is_array_aux_vars and all(
+            len(self.solution[key]) == n_time for key in self.keys
+        ):
+            self.calc_array_aux_var_solutions()
+            return
+
         for i_time, time in enumerate(self.times):
             for key in self.keys:
                 if key in self.solution and len(self.solution[key]) > i_time:
@@ -191,11 +279,193 @@ class BaseModel:
                 else:
                     self.var[key] = None
             self.calc_aux_vars()
+            self.calc_diagnostic_aux_vars()
             for key, value in self.aux_var.items():
                 if key not in self.solution:
                     self.solution[key] = []
                 self.solution[key].append(value)
 
+    def calc_array_aux_var_solutions(self):
+        n_time = len(self.times)
+        for key in self.keys:
+            self.var[key] = numpy.asarray(self.solution[key], dtype=float)
+        self.calc_aux_vars()
+        self.calc_diagnostic_aux_vars()
+        # kept as arrays, like the var solutions from the scipy integrators,
+        # so they pass straight through to plotting without a list copy
+        for key, value in self.aux_var.items():
+            self.solution[key] = numpy.array(numpy.broadcast_to(value, n_time), float)
+
+        # leave the vars and aux vars at the final time, as the
+        # step-by-step calculation does
+        for key in self.keys:
+            self.var[key] = self.solution[key][-1]
+        self.calc_aux_vars()
+        self.calc_diagnostic_aux_vars()
+
+    def run_sweep(self, param_sets, max_workers=1):
+        """
+        Integrates the model once for each dict of param overrides in
+        param_sets, with all the trajectories stacked into a single
+        call of the integrator: odeint, solve_ivp with self.solve_ivp_method
+        or rk4, as chosen by self.integrate_method, while euler_integrate
+        is not supported. Each param and var is then a numpy array over the
+        param sets, so this only works for models whose init_vars,
+        calc_aux_vars and calc_dvars use array-safe arithmetic.
+        Models with their own *_integrate method are instead swept
+        with a single call of it, which must then fill the solutions
+        with arrays over time and the param sets.
+        time and dt are shared by all the param sets.
+
+        For large sweeps, max_workers other than 1 splits the param sets
+        into one chunk per worker process, each swept by a fresh model
+        of the same class, with None for one worker per cpu.
+
+        :return: list of solutions, one per param set
+        """
+        # euler_integrate records each state after its step, with None
+        # past a break, which doesn't stack over the param sets
+        if hasattr(BaseModel, self.integrate_method) and self.integrate_method not in [
+            "scipy_odeint_integrate",
+            "scipy_solve_ivp_integrate",
+            "rk4_integrate",
+        ]:
+            raise ValueError(f"run_sweep can't use {self.integrate_method}")
+
+        # a misspelt key would otherwise silently run with the default
+        unknown_keys = set().union(*param_sets) - set(self.param)
+        if unknown_keys:
+            raise ValueError(f"param_sets have keys not in self.param: {unknown_keys}")
+
+        n_set = len(param_sets)
+        if n_set == 0:
+            return []
+        if max_workers != 1 and n_set > 1:
+            n_chunk = min(n_set, max_workers or os.cpu_count() or 1)
+            bounds = numpy.linspace(0, n_set, n_chunk + 1).astype(int)
+            with ProcessPoolExecutor(n_chunk) as executor:
+                futures = [
+                    executor.submit(
+                        run_sweep_in_new_model,
+                        type(self),
+                        dict(self.param),
+                        self.integrate_method,
+                        self.solve_ivp_method,
+                        param_sets[start:end],
+                    )
+                    for start, end in zip(bounds[:-1], bounds[1:])
+                ]
+                return [solution for f in futures for solution in f.result()]
+
+        saved_param = self.param
+        saved_solution, saved_times = self.solution, self.times
+        self.param = AttrDict()
+        for key, value in saved_param.items():
+            if key in ["time", "dt"]:
+                self.param[key] = value
+            else:
+                self.param[key] = numpy.array([p.get(key, value) for p in param_sets])
+
+        try:
+            self.init_vars()
+            # as in run, for models whose calc_dvars loop over self.keys
+            self.keys = keys = tuple(self.var.keys())
+            n_var = len(keys)
+
+            # the vars of each param set are kept next to each other, so
+            # the jacobian is banded and odeint only needs 2*n_var - 1
+            # evaluations to estimate it, however many param sets there are
+            def stack(values):
+                array = numpy.empty((n_set, n_var))
+                for i, value in enumerate(values):
+                    array[:, i] = value
+                return array.ravel()
+
+            def calc_dvar_array(var_array, t):
+                for key, row in zip(keys, var_array.reshape(n_set, n_var).T):
+                    self.var[key] = row
+                self.calc_aux_vars()
+                self.calc_dvars(t)
+                return stack(self.dvar[key] for key in keys)
+
+            times = numpy.arange(0, self.param.time, self.param.dt)
+            y_init = stack(self.var[key] for key in keys)
+            if self.integrate_method == "scipy_odeint_integrate":
+                output = odeint(
+                    calc_dvar_array, y_init, times, ml=n_var - 1, mu=n_var - 1
+                )
+            elif self.integrate_method == "scipy_solve_ivp_integrate":
+                output = self.solve_ivp_stacked(calc_dvar_array, y_init, times)
+            elif self.integrate_method == "rk4_integrate":
+                output = calc_rk4_output(
+                    calc_dvar_array, y_init, times, self.param.dt
+                )
+            else:
+                self.solution, self.times = AttrDict(), times
+                getattr(self, self.integrate_method)()
+                output = numpy.empty((len(times), n_set, n_var))
+                for i, key in enumerate(keys):
+                    solution = numpy.reshape(self.solution[key], (len(times), -1))
+                    output[:, :, i] = solution
+            # a broken-off integration stops all the param sets together
+            times = times[: len(output)]
+            output = numpy.reshape(output, (len(times), n_set, n_var))
+
+            aux_var_rows = {}
+            for i_time, var_rows in enumerate(output):
+                for key, row in zip(keys, var_rows.T):
+                    self.var[key] = row
+                self.calc_aux_vars()
+                self.calc_diagnostic_aux_vars()
+                for key, value in self.aux_var.items():
+                    if key not in aux_var_rows:
+                        aux_var_rows[key] = numpy.empty((len(times), n_set))
+                    aux_var_rows[key][i_time] = value
+        finally:
+            self.param = saved_param
+            self.solution, self.times = saved_solution, saved_times
+
+        solutions = []
+        for i_set in range(n_set):
+            solution = AttrDict()
+            for i, key in enumerate(keys):
+                solution[key] = output[:, i_set, i]
+            for key, rows in aux_var_rows.items():
+                solution[key] = rows[:, i_set]
+            solutions.append(solution)
+        return solutions
+
+    def solve_ivp_stacked(self, calc_dvar_array, y_init, times):
+        """
+        Integrates the stacked vars of run_sweep with solve_ivp and
+        self.solve_ivp_method, with the same tolerances and break-off
+        at a failure or non-finite vars as scipy_solve_ivp_integrate
+        """
+
+        def calc_finite_dvar_array(t, var_array):
+            dvar_array = calc_dvar_array(var_array, t)
+            if not numpy.all(numpy.isfinite(dvar_array)):
+                # as in scipy_solve_ivp_integrate, so LSODA doesn't stall
+                dvar_array[:] = math.nan
+            return dvar_array
+
+        result = solve_ivp(
+            calc_finite_dvar_array,
+            (times[0], times[-1]),
+            y_init,
+            method=self.solve_ivp_method,
+            t_eval=times,
+            rtol=1.49012e-8,
+            atol=1.49012e-8,
+        )
+        if not result.success:
+            logger.warning(f"solve_ivp {self.solve_ivp_method}: {result.message}")
+        output = result.y.T
+        is_finite = numpy.all(numpy.isfinite(output), axis=1)
+        if not numpy.all(is_finite):
+            output = output[: int(numpy.argmin(is_finite))]
+        return output
+
     def extract_editable_params(self):
         for k in self.param:
             if k == "dt":
@@ -211,6 +481,41 @@ class BaseModel:
                 self.editable_params.append({"key": k, "max": val})
 
 
+def calc_rk4_output(calc_dvar_array, y_init, times, dt):
+    """
+    Steps y_init with classical Runge-Kutta at the times, in increments
+    of dt, stopping after the first non-finite state
+
+    :return: array of the state at each time, down the first axis
+    """
+    y = y_init
+    output = numpy.empty((len(times), len(y_init)))
+    for i_time, t in enumerate(times):
+        output[i_time] = y
+        if not numpy.all(numpy.isfinite(y)):
+            return output[: i_time + 1]
+        k1 = calc_dvar_array(y, t)
+        k2 = calc_dvar_array(y + 0.5 * dt * k1, t + 0.5 * dt)
+        k3 = calc_dvar_array(y + 0.5 * dt * k2, t + 0.5 * dt)
+        k4 = calc_dvar_array(y + dt * k3, t + dt)
+        y = y + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return output
+
+
+def run_sweep_in_new_model(
+    model_class, param, integrate_method, solve_ivp_method, param_sets
+):
+    """
+    Runs run_sweep on a new model_class with the given params, as a
+    worker of run_sweep, since models with fns don't pickle
+    """
+    model = model_class()
+    model.param.update(param)
+    model.integrate_method = integrate_method
+    model.solve_ivp_method = solve_ivp_method
+    return model.run_sweep(param_sets)
+
+
 def make_exp_fn(x_val, y_val, scale, y_min):
     y_diff = y_val - y_min
     return lambda x: y_diff * math.exp((scale * (x - x_val)) / y_diff) + y_min
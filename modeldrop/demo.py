@@ -40,6 +40,12 @@ class TurchinEliteDemographicModel(BaseModel):
             self.param.stateAtHalfCarry,
         )
 
+        # the carry before any decline in production, fixed for a run
+        self.carry_at_no_decline = (
+            self.param.maxProductionRate * self.param.producerBirth
+            - self.param.producerDeath
+        ) / (self.param.maxProductionRate * self.param.producerBirth)
+
     def calc_aux_vars(self):
         self.aux_var.prodDecline = self.fn.prodDeclineFn(self.var.state)
 
@@ -55,16 +61,6 @@ class TurchinEliteDemographicModel(BaseModel):
         self.aux_var.eliteShare = self.aux_var.totalProduct * self.aux_var.eliteFraction
         self.aux_var.producerShare = self.aux_var.totalProduct - self.aux_var.eliteShare
 
-        self.aux_var.carry = (
-            (
-                self.param.maxProductionRate * self.param.producerBirth
-                - self.param.producerDeath
-            )
-            / self.aux_var.prodDecline
-            / self.param.maxProductionRate
-            / self.param.producerBirth
-        )
-
         self.aux_var.stateModifiedFraction = 1 - self.var.state / (
             self.param.stateAtHalfPeace + self.var.state
         )
@@ -73,6 +69,9 @@ class TurchinEliteDemographicModel(BaseModel):
         )
         self.aux_var.eliteDeath = self.var.elite * self.aux_var.eliteDeathRate
 
+    def calc_diagnostic_aux_vars(self):
+        self.aux_var.carry = self.carry_at_no_decline / self.aux_var.prodDecline
+
         self.aux_var.productPerElite = self.aux_var.eliteShare / self.var.elite
         self.aux_var.productPerProducer = self.aux_var.producerShare / self.var.producer
 
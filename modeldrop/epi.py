@@ -48,7 +48,7 @@ class StandardThreePartEpidemiologyModel(BaseModel):
         ]
 
     def calc_dvars(self, t):
-        for key in self.var.keys():
+        for key in self.keys:
             self.dvar[key] = 0
         self.add_to_dvars_from_flows()
 
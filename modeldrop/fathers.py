@@ -1,3 +1,5 @@
+import numpy
+
 from .basemodel import AttrDict, BaseModel
 
 
@@ -20,6 +22,11 @@ class TurchinFathersAndSonsModel(BaseModel):
 
         self.groups = ["naive", "moderate", "radical"]
 
+        # key lists are refilled in place by init_vars, so the
+        # age-group plots follow changes to nAge
+        self.pops = AttrDict({group: [] for group in self.groups})
+        self.age_vecs = AttrDict()
+
         self.init_vars()
 
         self.setup_ui()
@@ -27,9 +34,14 @@ class TurchinFathersAndSonsModel(BaseModel):
     def init_vars(self):
         self.param.nAge = int(self.param.nAge)
 
-        self.pops = AttrDict()
+        # drop age groups left over from a previous run with a larger nAge
+        self.var.clear()
+        self.dvar.clear()
+
         for group in self.groups:
-            self.pops[group] = [f"{group}_{age}" for age in range(self.param.nAge)]
+            self.pops[group][:] = [f"{group}_{age}" for age in range(self.param.nAge)]
+
+        self.delay_steps = int(self.param.delay / self.param.dt)
 
         for age in range(self.param.nAge):
             for group in self.groups:
@@ -42,18 +54,27 @@ class TurchinFathersAndSonsModel(BaseModel):
                     self.var[key] = 0.4 / self.param.nAge
 
     def calc_aux_vars(self):
+        get_var = self.var.__getitem__
         for group in self.groups:
-            vals = [self.var[n] for n in self.pops[group]]
-            vals = [v for v in vals if v is not None]
-            self.aux_var[ f"{group}_total"] = sum(vals)
-
-        i = int(self.param.delay / self.param.dt)
-        self.aux_var.radical_total_delayed = 0
-        for key in self.pops.radical:
-            if key not in self.solution:
-                continue
-            if len(self.solution[key]) > i:
-                self.aux_var.radical_total_delayed += self.solution[key][-i]
+            vals = tuple(map(get_var, self.pops[group]))
+            try:
+                self.aux_var[f"{group}_total"] = sum(vals)
+            except TypeError:
+                # only post-hoc solutions of a broken-off run carry None
+                self.aux_var[f"{group}_total"] = sum(v for v in vals if v is not None)
+            # age vectors gathered once here are reused by calc_dvars
+            self.age_vecs[group] = numpy.array(vals, dtype=float)
+
+        # read from the stored solution rows, rather than a history kept
+        # here, so the pass over the finished solutions reads the same rows
+        i = self.delay_steps
+        solution = self.solution
+        if len(solution.get(self.pops.radical[0], ())) > i:
+            self.aux_var.radical_total_delayed = sum(
+                solution[key][-i] for key in self.pops.radical
+            )
+        else:
+            self.aux_var.radical_total_delayed = 0
 
         self.aux_var.rho = self.param.disenchantment * self.aux_var.radical_total_delayed
 
@@ -62,22 +83,30 @@ class TurchinFathersAndSonsModel(BaseModel):
         )
 
     def calc_dvars(self, t):
-        self.dvar = {}
-
-        for k in self.keys:
-            self.dvar[k] = -self.var[k]
-
-        self.dvar[f"naive_0"] += 1.0 / self.param.nAge
-
-        for j in range(1, self.param.nAge):
-            i = j - 1
-            self.dvar[f"naive_{j}"] += self.var[f"naive_{i}"] * (1 - self.aux_var.sigma)
-            self.dvar[f"radical_{j}"] += self.var[f"radical_{i}"] * (
-                1 - self.aux_var.rho
-            )
-            self.dvar[f"radical_{j}"] += self.var[f"naive_{i}"] * self.aux_var.sigma
-            self.dvar[f"moderate_{j}"] += self.var[f"moderate_{i}"]
-            self.dvar[f"moderate_{j}"] += self.var[f"radical_{i}"] * self.aux_var.rho
+        n_age = self.param.nAge
+        naive = self.age_vecs.naive
+        radical = self.age_vecs.radical
+        moderate = self.age_vecs.moderate
+        sigma = self.aux_var.sigma
+        rho = self.aux_var.rho
+
+        # each age group ages into the next one, spilling over
+        # between groups as a banded shift of the age vectors
+        d_naive = -naive
+        d_naive[0] += 1.0 / n_age
+        d_naive[1:] += naive[:-1] * (1 - sigma)
+
+        d_radical = -radical
+        d_radical[1:] += radical[:-1] * (1 - rho)
+        d_radical[1:] += naive[:-1] * sigma
+
+        d_moderate = -moderate
+        d_moderate[1:] += moderate[:-1]
+        d_moderate[1:] += radical[:-1] * rho
+
+        self.dvar.update(zip(self.pops.naive, d_naive.tolist()))
+        self.dvar.update(zip(self.pops.radical, d_radical.tolist()))
+        self.dvar.update(zip(self.pops.moderate, d_moderate.tolist()))
 
     def setup_ui(self):
         self.plots = [
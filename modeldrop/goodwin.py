@@ -1,3 +1,5 @@
+import numpy
+
 from .basemodel import BaseModel, make_cutoff_fn, make_sq_fn
 
 
@@ -14,8 +16,13 @@ class GoodwinBusinessCycleModel(BaseModel):
         self.param.time = 100
         self.param.dt = 0.1
 
-        wageSqFn = make_sq_fn(0.000_064_1, 1, 1, 0.040_064_1)
-        self.fn.wageChangeFn = make_cutoff_fn(wageSqFn, 0.9999)
+        # the coefficients and cutoff are also kept for
+        # calc_array_wage_change, used by run_sweep
+        self.wage_sq_coeffs = (0.000_064_1, 1, 1, 0.040_064_1)
+        self.wage_cutoff = 0.9999
+        wageSqFn = make_sq_fn(*self.wage_sq_coeffs)
+        self.fn.wageChangeFn = make_cutoff_fn(wageSqFn, self.wage_cutoff)
+        self.wage_change_max = wageSqFn(self.wage_cutoff)
 
         self.setup_ui()
 
@@ -26,6 +33,22 @@ class GoodwinBusinessCycleModel(BaseModel):
         laborFraction = 0.9
         self.var.labor = laborFraction * self.var.population
 
+        # run_sweep makes the params arrays, which wageChangeFn can't take
+        if isinstance(self.param.accelerator, numpy.ndarray):
+            self.wage_change_fn = self.calc_array_wage_change
+        else:
+            self.wage_change_fn = self.fn.wageChangeFn
+
+    def calc_array_wage_change(self, laborFraction):
+        """
+        The wageChangeFn for an array of laborFraction, where clamping
+        before and after the square curve is the same as its cutoff
+        """
+        A, B, C, D = self.wage_sq_coeffs
+        laborFraction = numpy.minimum(laborFraction, self.wage_cutoff)
+        num = B - C * laborFraction
+        return numpy.minimum(A / num / num - D, self.wage_change_max)
+
     def calc_aux_vars(self):
         self.aux_var.laborFraction = self.var.labor / self.var.population
         self.aux_var.output = self.var.labor * self.var.productivity
@@ -42,7 +65,7 @@ class GoodwinBusinessCycleModel(BaseModel):
             - self.param.productivityRate
         )
         self.dvar.wage = (
-            self.fn.wageChangeFn(self.aux_var.laborFraction) * self.var.wage
+            self.wage_change_fn(self.aux_var.laborFraction) * self.var.wage
         )
         self.dvar.productivity = self.param.productivityRate * self.var.productivity
         self.dvar.population = self.param.birthRate * self.var.population
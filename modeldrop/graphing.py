@@ -98,7 +98,9 @@ which looks like:
 `graph_type` available:
 
 - ``line`` - plots a single line with modifiers, lines can 
-  be modified with ``linewidth``, ``linestyle`` and ``color``
+  be modified with ``linewidth``, ``linestyle`` and ``color``.
+  More than 4 consecutive lines without ``label`` or ``marker`` on an axis
+  are drawn together as a single ``LineCollection``
 - ``scatter`` - plots markers with modifiers ``markersize`` and ``color``
 - ``fillbetween`` - plots the area between two sets of yvals
   stored in `ystacks`
@@ -149,22 +151,41 @@ white background transparent in the resultant .png file. This
 allows more involved graphic-design in resultant powerpoint
 presentations with themed backgrounds.
 
+The graph dict is also saved next to the .png as a .json file, which
+can be skipped with ``json_sidecar=False``, or written compactly
+as a gzipped .json.gz with ``json_compress=True``. Values of nan or
+inf, as in a run that broke off, are written as null, with or
+without orjson installed.
+
+``write_graphs`` writes a list of graphs the same way, rendering
+them in parallel in a pool of worker processes.
+
 """
 
 import colorsys
 import datetime
+import functools
+import gzip
 import json
 import logging
+import math
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib
 import numpy
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+from matplotlib.collections import LineCollection
 from matplotlib.dates import date2num
 from matplotlib.figure import Figure
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 count_color = (0, 1, 0, 0.2)
@@ -172,50 +193,94 @@ count_color = (0, 1, 0, 0.2)
 
 def is_date(d) -> bool:
     """Checks if d is a date-like object"""
-    if isinstance(d, datetime.datetime):
-        return True
-    return False
+    return isinstance(d, datetime.datetime)
 
 
-def get_kwargs(o: dict, keys: list) -> dict:
+def get_kwargs(o: dict, keys: tuple) -> dict:
     """
     Returns object with key-value pairs specified by keys
     """
-    kwargs = {}
-    for key in keys:
-        if key in o:
-            kwargs[key] = o[key]
-    return kwargs
+    return {key: o[key] for key in keys if key in o}
 
 
 def write_json(o, fname):
-    write_file(json_dumps(o), fname)
+    write_file(json_dumps_bytes(o), fname)
+
+
+def write_gzip_json(o, fname):
+    """
+    Writes compact JSON without indents through gzip
+    """
+    ensure_dir(os.path.dirname(fname))
+    with gzip.open(fname, "wb") as f:
+        f.write(json_dumps_bytes(o, indent=None))
 
 
 def write_file(txt, fname):
     """
-    Convenience wrapper that checks for directory and uses block scope
+    Convenience wrapper that checks for directory and uses block scope,
+    bytes are written as is in binary mode
     """
     ensure_dir(os.path.dirname(fname))
-    with open(fname, "w") as f:
+    with open(fname, "wb" if isinstance(txt, bytes) else "w") as f:
         f.write(txt)
 
 
-def json_dumps(o):
+def json_dumps(o, indent=2):
     """
-    Convenience dumper to JSON-string that converts datetimes to datetime strings
+    Convenience dumper to JSON-string that converts datetimes to datetime strings,
+    uses orjson if it is installed and indent is 2 or None, see json_dumps_bytes
     """
-    return json.dumps(o, default=json_converter, indent=2)
+    return json_dumps_bytes(o, indent).decode()
+
+
+def json_dumps_bytes(o, indent=2):
+    """
+    As json_dumps but to UTF-8 bytes, which orjson produces directly.
+
+    Both paths write nan and inf as null, non-str keys as strings and
+    non-ASCII characters unescaped, so the output only differs in the
+    exponent of floats (orjson 1e-7, json 1e-07)
+    """
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(o, default=json_converter, option=option)
+    kwargs = {"default": json_converter, "ensure_ascii": False, "allow_nan": False}
+    if indent is None:
+        kwargs["separators"] = (",", ":")
+    else:
+        kwargs["indent"] = indent
+    try:
+        txt = json.dumps(o, **kwargs)
+    except ValueError:
+        txt = json.dumps(replace_non_finite(o), **kwargs)
+    return txt.encode()
+
+
+def replace_non_finite(o):
+    """
+    Returns a copy of o with nan and inf floats replaced by None, as orjson does
+    """
+    if isinstance(o, (float, numpy.floating)):
+        return float(o) if math.isfinite(o) else None
+    if isinstance(o, numpy.ndarray):
+        return replace_non_finite(o.tolist())
+    if isinstance(o, dict):
+        return {k: replace_non_finite(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [replace_non_finite(v) for v in o]
+    return o
 
 
 def ensure_dir(d):
     """
     Makes a directory if it does not already exist
     """
-    if d is "":
+    if not d:
         return
-    if not os.path.isdir(d):
-        os.makedirs(d)
+    os.makedirs(d, exist_ok=True)
 
 
 def json_converter(o):
@@ -225,15 +290,25 @@ def json_converter(o):
     if isinstance(o, datetime.datetime):
         return o.isoformat()
     if isinstance(o, numpy.ndarray):
-        return list(o)
+        return o.tolist()
+    if isinstance(o, numpy.generic):
+        return o.item()
+
+
+# palette of the style set by init(), read once for get_default_color
+default_colors = []
 
 
 def init():
     matplotlib.style.use("ggplot")
+    default_colors[:] = plt.rcParams["axes.prop_cycle"].by_key()["color"]
 
 
 init()
 
+# legends copy their font properties, so one instance serves every figure
+legend_font = matplotlib.font_manager.FontProperties()
+
 
 def create_graph() -> dict:
     """
@@ -270,6 +345,14 @@ def lighten_color(color, amount=None, opacity=None):
         lighten_color((.3,.55,.1), 0.5)
 
     """
+    if not isinstance(color, str):
+        color = tuple(color)
+    return calc_lightened_color(color, amount, opacity)
+
+
+@functools.lru_cache(maxsize=1024)
+def calc_lightened_color(color, amount, opacity):
+    """Cached body of lighten_color, color must be hashable"""
     try:
         c = matplotlib.colors.cnames[color]
     except:
@@ -285,16 +368,196 @@ def lighten_color(color, amount=None, opacity=None):
 
 def get_default_color(i):
     """Returns the ith color in the default matplotlib palette"""
-    cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
-    return cycle[i % len(cycle)]
+    return default_colors[i % len(default_colors)]
 
 
 def get_rgb(color):
     """Returns a 3-tuple from a color or color string"""
+    if not isinstance(color, str):
+        color = tuple(color)
+    return calc_rgb(color)
+
+
+@functools.lru_cache(maxsize=512)
+def calc_rgb(color):
+    """Cached body of get_rgb, color must be hashable"""
     return matplotlib.colors.to_rgb(color)
 
 
-def make_matplotlib_figure(graph: dict, png: str) -> Figure:
+def is_collection_line(dataset) -> bool:
+    """Checks if dataset is a plain line that can go in a LineCollection"""
+    if dataset["graph_type"] != "line":
+        return False
+    return "label" not in dataset and "marker" not in dataset
+
+
+def add_line_collection(ax, datasets):
+    """
+    Adds line datasets to ax as a single LineCollection, with
+    colors taken from the default palette where not given
+    """
+    segments, colors, linestyles, linewidths = [], [], [], []
+    i_color = 0
+    for dataset in datasets:
+        xvals = numpy.asarray(dataset["xvals"], dtype=float)
+        yvals = numpy.asarray(dataset["yvals"], dtype=float)
+        segments.append(numpy.column_stack([xvals, yvals]))
+        if dataset.get("color") is not None:
+            colors.append(dataset["color"])
+        else:
+            colors.append(get_default_color(i_color))
+            i_color += 1
+        linestyles.append(dataset.get("ls", dataset.get("linestyle", "-")))
+        linewidths.append(
+            dataset.get("linewidth", matplotlib.rcParams["lines.linewidth"])
+        )
+    ax.add_collection(
+        LineCollection(
+            segments, colors=colors, linestyles=linestyles, linewidths=linewidths
+        )
+    )
+    ax.autoscale_view()
+
+
+def draw_plain_lines(ax, datasets):
+    """
+    Draws a run of plain line datasets, as a single LineCollection
+    if there are more than 4, else as a Line2D each
+    """
+    if len(datasets) > 4:
+        add_line_collection(ax, datasets)
+    else:
+        for dataset in datasets:
+            draw_line(ax, dataset)
+
+
+def add_guide_lines(ax, guides, coord, kwarg_keys):
+    """
+    Adds vlines (coord="x") or hlines (coord="y") that span the axis,
+    with one LineCollection per distinct style rather than a Line2D
+    per guide as in ax.axvline and ax.axhline
+    """
+    styles = []
+    for guide in guides:
+        kwargs = get_kwargs(guide, kwarg_keys)
+        for style in styles:
+            if style["kwargs"] == kwargs:
+                style["vals"].append(guide[coord])
+                break
+        else:
+            styles.append({"kwargs": kwargs, "vals": [guide[coord]]})
+
+    for style in styles:
+        vals = style["vals"]
+        if coord == "x":
+            segments = [[(x, 0), (x, 1)] for x in vals]
+            transform = ax.get_xaxis_transform()
+        else:
+            segments = [[(0, y), (1, y)] for y in vals]
+            transform = ax.get_yaxis_transform()
+        lines = LineCollection(segments, transform=transform, **style["kwargs"])
+        ax.add_collection(lines, autolim=False)
+
+        # as in axvline/axhline, only the data coordinate of the guides
+        # counts, and only rescales if a guide is outside the current view
+        is_x = coord == "x"
+        lower, upper = ax.get_xbound() if is_x else ax.get_ybound()
+        is_outside = any(v < lower or v > upper for v in vals)
+        ax.update_datalim([(v, v) for v in vals], updatex=is_x, updatey=not is_x)
+        if is_outside:
+            ax.autoscale_view(scalex=is_x, scaley=not is_x)
+
+
+# matplotlib keyword arguments that are passed through from each graph_type
+line_kwarg_keys = (
+    "label",
+    "color",
+    "ls",
+    "linestyle",
+    "linewidth",
+    "marker",
+    "markersize",
+)
+scatter_kwarg_keys = ("label", "color", "ls", "marker", "s", "facecolor")
+errorbar_kwarg_keys = (
+    "label",
+    "color",
+    "marker",
+    "fmt",
+    "markersize",
+    "elinewidth",
+    "ecolor",
+    "facecolor",
+)
+bar_kwarg_keys = ("label", "color", "facecolor", "width")
+fillbetween_kwarg_keys = ("label", "color")
+stack_kwarg_keys = ("colors",)
+label_kwarg_keys = ("linestyle", "ls", "linewidth")
+counts_kwarg_keys = ("label", "color")
+vline_kwarg_keys = ("ls", "color", "linewidth")
+hline_kwarg_keys = ("ls", "linestyle", "color", "linewidth")
+
+
+def draw_line(ax, dataset):
+    kwargs = get_kwargs(dataset, line_kwarg_keys)
+    ax.plot(dataset["xvals"], dataset["yvals"], **kwargs)
+
+
+def draw_scatter(ax, dataset):
+    kwargs = get_kwargs(dataset, scatter_kwarg_keys)
+    ax.scatter(dataset["xvals"], dataset["yvals"], **kwargs)
+
+
+def draw_errorbar(ax, dataset):
+    kwargs = get_kwargs(dataset, errorbar_kwarg_keys)
+    ax.errorbar(dataset["xvals"], dataset["yvals"], yerr=dataset["errors"], **kwargs)
+
+
+def draw_bar(ax, dataset):
+    kwargs = get_kwargs(dataset, bar_kwarg_keys)
+    ax.bar(dataset["xvals"], dataset["yvals"], edgecolor="none", **kwargs)
+
+
+def draw_fillbetween(ax, dataset):
+    kwargs = get_kwargs(dataset, fillbetween_kwarg_keys)
+    ax.fill_between(
+        dataset["xvals"], dataset["ystacks"][0], dataset["ystacks"][1], **kwargs,
+    )
+
+
+def draw_stack(ax, dataset):
+    kwargs = get_kwargs(dataset, stack_kwarg_keys)
+    ax.stackplot(dataset["xvals"], dataset["ystacks"], **kwargs)
+    for label, color in zip(reversed(dataset["labels"]), reversed(dataset["colors"])):
+        ax.plot([], [], label=label, color=color)
+
+
+def draw_label(ax, dataset):
+    kwargs = get_kwargs(dataset, label_kwarg_keys)
+    ax.plot([], [], label=dataset["label"], color=dataset["color"], **kwargs)
+
+
+# draws a dataset on an axis by graph_type, counts are drawn
+# separately after the limits of the graph have been set
+draw_fns = {
+    "line": draw_line,
+    "scatter": draw_scatter,
+    "errorbar": draw_errorbar,
+    "bar": draw_bar,
+    "fillbetween": draw_fillbetween,
+    "stack": draw_stack,
+    "label": draw_label,
+    "counts": None,
+}
+
+
+def make_matplotlib_figure(
+    graph: dict,
+    png: str,
+    figure: Figure = None,
+    transparent=False,
+    compress_level=None,
+) -> Figure:
     """
     Generates a matplotlib figure from a graph dictionary, which
     is described in the module docstring.
@@ -302,31 +565,49 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
     Avoids using the pyplot figure manager and thus can
     be gc managed by standard Python
     https://stackoverflow.com/questions/16334588/create-a-figure-that-is-reference-counted/16337909#16337909
+
+    An existing figure can be passed in to be cleared and redrawn,
+    so that a run of graphs shares one figure and Agg canvas.
+    With transparent, the white background of the .png is made
+    transparent, as in make_png_transparent, before it is written.
+    A zlib compress_level from 0 to 9 writes the .png through Pillow,
+    where 1 is quicker than the default of 6 for larger files.
     """
     figsize = graph.get("figsize", [15, 4])
     if graph.get("is_compact"):
         figsize = (figsize[0], 2)
 
-    figure = Figure(figsize=figsize)
+    if figure is None:
+        figure = Figure(figsize=figsize)
+    else:
+        figure.clear()
+        figure.set_size_inches(figsize)
 
     ax1 = figure.add_subplot(111)
     axes = [ax1]
+
+    # in a single pass, sort the datasets by axis, pick out
+    # the counts, and decide if we have dates or scalar x-axis
+    primary_datasets = []
+    secondary_datasets = []
+    counts_datasets = []
+    is_xaxis_date = False
+    is_x_empty = True
     for dataset in graph.get("datasets", []):
         if dataset.get("secondary"):
+            secondary_datasets.append(dataset)
             ax2 = ax1.twinx()
             ax2.grid(False)
             axes.append(ax2)
-
-    # decide if we have dates or scalar x-axis
-    is_xaxis_date = False
-    is_x_empty = True
-    for dataset in graph.get("datasets", []):
+        else:
+            primary_datasets.append(dataset)
+        if dataset["graph_type"] == "counts":
+            counts_datasets.append(dataset)
         xvals = dataset.get("xvals", [])
         if len(xvals) > 0:
             is_x_empty = False
-            if is_date(xvals[0]):
+            if not is_xaxis_date and is_date(xvals[0]):
                 is_xaxis_date = True
-                break
 
     # Following needs to be done for both primary
     # and secondary axes to keep them in sync
@@ -335,43 +616,42 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
         # relative to the png, allowing sufficent
         # space for axis decorations such as ticks
         # and legends
-        bounds = list(ax.get_position().bounds)
+        # bounds are [left, bottom, width, height], worked out
+        # in full before a single set_position
         y_spacer = 1 / figsize[1] * 0.5
-        bounds[0] = 0.07
-        bounds[2] = 0.87
-        bounds[1] = y_spacer
-        bounds[3] = 1.0 - 1.5 * y_spacer
-        ax.set_position(bounds, which="both")
+        bounds = [0.07, y_spacer, 0.87, 1.0 - 1.5 * y_spacer]
 
         if graph.get("is_compact"):
-            bounds = list(ax.get_position().bounds)
             bounds[1] = 0.15
             bounds[3] = 0.85
-            ax.set_position(bounds, which="both")
 
         if not graph.get("is_flush_right"):
-            bounds = list(ax.get_position().bounds)
             bounds[0] = 0.07
             bounds[2] = 0.77
-            ax.set_position(bounds, which="both")
 
         if graph.get("is_summary_table"):
-            bounds = list(ax.get_position().bounds)
             bounds[0] = 0.35
             bounds[2] = 0.4
-            ax.set_position(bounds, which="both")
+
+        ax.set_position(bounds, which="both")
 
         ax2_color = get_default_color(0)
         ax2_ylabel = ""
 
-        # loop through all the graph views
-        for dataset in graph.get("datasets", []):
+        ax_datasets = primary_datasets if ax == ax1 else secondary_datasets
 
-            if ax == ax1 and dataset.get("secondary"):
-                continue
+        # consecutive plain lines without legend entries are held
+        # back, so that a long run of them can be drawn as a single
+        # LineCollection in their place in the drawing order
+        plain_line_datasets = []
 
-            if ax != ax1 and not dataset.get("secondary"):
-                continue
+        # lines and errorbars without a color are given the next color
+        # of the palette here, in the order that ax.plot would take them
+        # from the color cycle of the axis, which a LineCollection skips
+        i_line_color = 0
+
+        # loop through all the graph views
+        for dataset in ax_datasets:
 
             if ax != ax1:
                 if dataset.get("color"):
@@ -379,69 +659,26 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
                 if dataset.get("secondary_ylabel"):
                     ax2_ylabel = dataset["secondary_ylabel"]
 
-            if dataset["graph_type"] == "line":
-                kwargs = get_kwargs(
-                    dataset,
-                    [
-                        "label",
-                        "color",
-                        "ls",
-                        "linestyle",
-                        "linewidth",
-                        "marker",
-                        "markersize",
-                    ],
-                )
-                ax.plot(dataset["xvals"], dataset["yvals"], **kwargs)
-            elif dataset["graph_type"] == "scatter":
-                kwargs = get_kwargs(
-                    dataset, ["label", "color", "ls", "marker", "s", "facecolor"]
-                )
-                ax.scatter(dataset["xvals"], dataset["yvals"], **kwargs)
-            elif dataset["graph_type"] == "errorbar":
-                kwargs = get_kwargs(
-                    dataset,
-                    [
-                        "label",
-                        "color",
-                        "marker",
-                        "fmt",
-                        "markersize",
-                        "elinewidth",
-                        "ecolor",
-                        "facecolor",
-                    ],
-                )
-                ax.errorbar(
-                    dataset["xvals"], dataset["yvals"], yerr=dataset["errors"], **kwargs
-                )
-            elif dataset["graph_type"] == "bar":
-                kwargs = get_kwargs(dataset, ["label", "color", "facecolor", "width"])
-                ax.bar(dataset["xvals"], dataset["yvals"], edgecolor="none", **kwargs)
-            elif dataset["graph_type"] == "fillbetween":
-                kwargs = get_kwargs(dataset, ["label", "color"])
-                ax.fill_between(
-                    dataset["xvals"],
-                    dataset["ystacks"][0],
-                    dataset["ystacks"][1],
-                    **kwargs,
-                )
-            elif dataset["graph_type"] == "stack":
-                kwargs = get_kwargs(dataset, ["colors"])
-                ax.stackplot(dataset["xvals"], dataset["ystacks"], **kwargs)
-                for label, color in zip(
-                    reversed(dataset["labels"]), reversed(dataset["colors"])
-                ):
-                    ax.plot([], [], label=label, color=color)
-            elif dataset["graph_type"] == "label":
-                kwargs = get_kwargs(dataset, ["linestyle", "ls", "linewidth"])
-                ax.plot(
-                    [], [], label=dataset["label"], color=dataset["color"], **kwargs
-                )
-            elif dataset["graph_type"] == "counts":
-                pass  # handle after limits
-            else:
+            if dataset["graph_type"] in ["line", "errorbar"]:
+                if dataset.get("color") is None:
+                    color = get_default_color(i_line_color)
+                    dataset = {**dataset, "color": color}
+                    i_line_color += 1
+
+            if not is_xaxis_date and is_collection_line(dataset):
+                plain_line_datasets.append(dataset)
+                continue
+
+            draw_plain_lines(ax, plain_line_datasets)
+            plain_line_datasets = []
+
+            if dataset["graph_type"] not in draw_fns:
                 raise Exception(f"Did not recognize graph_type={dataset['graph_type']}")
+            draw_fn = draw_fns[dataset["graph_type"]]
+            if draw_fn is not None:
+                draw_fn(ax, dataset)
+
+        draw_plain_lines(ax, plain_line_datasets)
 
         if ax != ax1:
             if ax2_ylabel:
@@ -492,16 +729,10 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
             ax.set_xlim(right=graph["xmax"])
 
     if graph.get("vlines"):
-        for vline in graph["vlines"]:
-            x = vline["x"]
-            kwargs = get_kwargs(vline, ["ls", "color", "linewidth"])
-            ax1.axvline(x, **kwargs)
+        add_guide_lines(ax1, graph["vlines"], "x", vline_kwarg_keys)
 
     if graph.get("hlines"):
-        for hline in graph["hlines"]:
-            y = hline["y"]
-            kwargs = get_kwargs(hline, ["ls", "linestyle", "color", "linewidth"])
-            ax1.axhline(y, **kwargs)
+        add_guide_lines(ax1, graph["hlines"], "y", hline_kwarg_keys)
 
     if graph.get("ymin") is not None:
         ax1.set_ylim(bottom=graph["ymin"])
@@ -543,8 +774,7 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
     # format and move the legend to the right-hand side
     # out of the central graphing area
     if graph.get("is_legend"):
-        font = matplotlib.font_manager.FontProperties()
-        legend = ax1.legend(bbox_to_anchor=(1, 1), loc="upper left", prop=font)
+        legend = ax1.legend(bbox_to_anchor=(1, 1), loc="upper left", prop=legend_font)
         frame = legend.get_frame()
         frame.set_facecolor("none")
         frame.set_edgecolor("none")
@@ -570,21 +800,20 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
     # of the graph which is 0.1 of the graph height
     is_count = False
     max_count = None
-    for dataset in graph.get("datasets", []):
-        if dataset["graph_type"] == "counts":
-            kwargs = get_kwargs(dataset, ["label", "color"])
-            ymin, ymax = ax1.get_ylim()
-            ax1.set_ylim(bottom=ymin)
-            yvals = dataset["yvals"]
-            val_max = max(yvals)
-            if max_count is None:
-                max_count = val_max
-            elif val_max > max_count:
-                max_count = val_max
-            yvals = [v / val_max * 0.1 * (ymax - ymin) + ymin for v in yvals]
-            lowers = [ymin] * len(yvals)
-            ax1.fill_between(dataset["xvals"], yvals, lowers, **kwargs)
-            is_count = True
+    for dataset in counts_datasets:
+        kwargs = get_kwargs(dataset, counts_kwarg_keys)
+        ymin, ymax = ax1.get_ylim()
+        ax1.set_ylim(bottom=ymin)
+        # max of the original values, so int counts print as ints
+        val_max = max(dataset["yvals"])
+        if max_count is None:
+            max_count = val_max
+        elif val_max > max_count:
+            max_count = val_max
+        yvals = numpy.asarray(dataset["yvals"], dtype=float)
+        yvals = yvals / val_max * 0.1 * (ymax - ymin) + ymin
+        ax1.fill_between(dataset["xvals"], yvals, ymin, **kwargs)
+        is_count = True
 
     if is_count:
         text = f"{max_count} wells"
@@ -600,39 +829,112 @@ def make_matplotlib_figure(graph: dict, png: str) -> Figure:
         )
 
     if png is not None:
-        FigureCanvas(figure).print_figure(png)
+        if not isinstance(figure.canvas, FigureCanvas):
+            FigureCanvas(figure)
+        if transparent or compress_level is not None:
+            # the rendered pixels are made transparent in memory,
+            # rather than writing the .png and reading it back
+            buffer, size = figure.canvas.print_to_buffer()
+            img = Image.frombuffer("RGBA", size, buffer, "raw", "RGBA", 0, 1)
+            if transparent:
+                img = make_image_transparent(img)
+            if compress_level is None:
+                compress_level = 6
+            img.save(png, "PNG", compress_level=compress_level)
+        else:
+            figure.canvas.print_figure(png)
 
     return figure
 
 
-def make_png_transparent(png, target=(255, 255, 255)):
-    img = Image.open(png)
-    img = img.convert("RGBA")
-    datas = img.getdata()
-    new_data = []
-    for item in datas:
-        if item[0] == target[0] and item[1] == target[1] and item[2] == target[2]:
-            new_data.append((*target, 0))
-        else:
-            new_data.append(item)
-    img.putdata(new_data)
-    img.save(png, "PNG")
+def make_image_transparent(img, target=(255, 255, 255)):
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    # only a new alpha channel is built, the RGB channels are
+    # read without copying them into a writeable array
+    pixels = numpy.asarray(img)
+    is_target = numpy.all(pixels[:, :, :3] == target, axis=-1)
+    alpha = numpy.where(is_target, 0, pixels[:, :, 3]).astype(numpy.uint8)
+    img.putalpha(Image.fromarray(alpha, "L"))
+    return img
 
 
-def write_graph(graph, directory=".", transparent=False):
+def make_png_transparent(png, target=(255, 255, 255)):
+    make_image_transparent(Image.open(png), target).save(png, "PNG")
+
+
+def write_graph(
+    graph,
+    directory=".",
+    transparent=False,
+    json_sidecar=True,
+    json_compress=False,
+    figure=None,
+    compress_level=None,
+):
     """Generates a .png from a graph dict, with a flag
-    to turn the white background transparent."""
-    json_fname = os.path.join(directory, graph["basename"] + ".json")
-    write_json(graph, json_fname)
+    to turn the white background transparent. The graph dict is also
+    written as a .json sidecar, unless json_sidecar is False, and
+    json_compress writes it compactly as .json.gz instead. A figure
+    can be passed in to be reused, and compress_level sets the zlib
+    level of the .png, as in make_matplotlib_figure."""
+    ensure_dir(directory)
+    if json_sidecar:
+        json_fname = os.path.join(directory, graph["basename"] + ".json")
+        if json_compress:
+            write_gzip_json(graph, json_fname + ".gz")
+        else:
+            write_json(graph, json_fname)
     png = os.path.join(directory, graph["basename"] + ".png")
     graph["png"] = os.path.basename(png)
     logger.info(f"write_graph {png}")
-    make_matplotlib_figure(graph, png)
-    if transparent:
-        make_png_transparent(png)
+    make_matplotlib_figure(graph, png, figure, transparent, compress_level)
     return png
 
 
+def write_graphs(
+    graphs,
+    directory=".",
+    transparent=False,
+    json_sidecar=True,
+    json_compress=False,
+    max_workers=None,
+    compress_level=None,
+):
+    """Generates .pngs from a list of graph dicts, as in write_graph,
+    but renders them in parallel in a pool of worker processes, unless
+    max_workers is 1. The pool needs the calling script to have an
+    if __name__ == "__main__" guard.
+
+    :return: list of .png filenames
+    """
+    ensure_dir(directory)
+    args = (directory, transparent, json_sidecar, json_compress)
+    if len(graphs) <= 1 or max_workers == 1:
+        # rendered one after another, the graphs can share a figure
+        figure = Figure()
+        return [
+            write_graph(graph, *args, figure, compress_level) for graph in graphs
+        ]
+    # each worker is given a chunk of the graphs, so that the graphs
+    # within a chunk share a figure, as above
+    n_chunk = min(len(graphs), max_workers or os.cpu_count() or 1)
+    chunks = [graphs[i::n_chunk] for i in range(n_chunk)]
+    with ProcessPoolExecutor(n_chunk) as executor:
+        futures = [
+            executor.submit(write_graphs, chunk, *args, 1, compress_level)
+            for chunk in chunks
+        ]
+        chunk_pngs = [future.result() for future in futures]
+    pngs = [None] * len(graphs)
+    for i, png_list in enumerate(chunk_pngs):
+        pngs[i::n_chunk] = png_list
+    # the workers only set "png" on their own copies of the graphs
+    for graph, png in zip(graphs, pngs):
+        graph["png"] = os.path.basename(png)
+    return pngs
+
+
 def make_vline(x, color):
     return {
         "x": x,
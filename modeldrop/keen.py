@@ -23,6 +23,8 @@ class KeenDynamicEconomyModel(BaseModel):
         self.param.initialWage = 0.850
         self.param.initialLaborFraction = 0.61
 
+        self.is_array_aux_vars = True
+
         self.setup_ui()
 
     def init_vars(self):
@@ -43,56 +45,62 @@ class KeenDynamicEconomyModel(BaseModel):
         self.var.debtRatio = 0.0
 
     def calc_aux_vars(self):
-        self.aux_var.labor = self.var.laborFraction * self.var.population
-        self.aux_var.wageDelta = self.fn.wageFn(self.var.laborFraction)
-        self.aux_var.laborWages = self.var.wage * self.aux_var.labor
-        self.aux_var.wages = self.var.wage * self.aux_var.labor
+        # the dicts are bound to locals, as this is called for every
+        # evaluation of the derivatives
+        var = self.var
+        aux_var = self.aux_var
+        param = self.param
 
-        self.aux_var.capital = self.var.output * self.param.outputAccelerator
+        aux_var.labor = var.laborFraction * var.population
+        # wageFn and investFn are inlined here, and kept for their plots
+        aux_var.wageDelta = param.wageSlope * (var.laborFraction - param.wageXOrigin)
+        aux_var.wages = var.wage * aux_var.labor
 
-        self.aux_var.bankShare = self.param.interestRate * self.var.debtRatio
-        self.aux_var.profitShare = 1 - self.var.wageShare - self.aux_var.bankShare
+        aux_var.capital = var.output * param.outputAccelerator
 
-        self.aux_var.profitRate = (
-            self.aux_var.profitShare / self.param.outputAccelerator
-        )
+        aux_var.bankShare = param.interestRate * var.debtRatio
+        aux_var.profitShare = 1 - var.wageShare - aux_var.bankShare
+
+        aux_var.profitRate = aux_var.profitShare / param.outputAccelerator
 
-        self.aux_var.investDelta = self.fn.investFn(self.aux_var.profitRate)
-        self.aux_var.investment = self.aux_var.investDelta * self.var.output
-        self.aux_var.realGrowthRate = (
-            self.aux_var.investDelta / self.param.outputAccelerator
-            - self.param.depreciationRate
+        aux_var.investDelta = param.investSlope * (
+            aux_var.profitRate - param.investXOrigin
+        )
+        aux_var.investment = aux_var.investDelta * var.output
+        aux_var.realGrowthRate = (
+            aux_var.investDelta / param.outputAccelerator - param.depreciationRate
         )
 
-        self.aux_var.debt = self.var.debtRatio * self.var.output
-        self.aux_var.bank = self.aux_var.bankShare * self.var.output
-        self.aux_var.profit = self.aux_var.profitShare * self.var.output
+        aux_var.debt = var.debtRatio * var.output
+        aux_var.bank = aux_var.bankShare * var.output
+        aux_var.profit = aux_var.profitShare * var.output
 
-        self.aux_var.borrow = self.aux_var.investment - self.aux_var.profit
+        aux_var.borrow = aux_var.investment - aux_var.profit
 
     def calc_dvars(self, t):
-        self.dvar.wage = self.aux_var.wageDelta * self.var.wage
+        var = self.var
+        aux_var = self.aux_var
+        param = self.param
+        dvar = self.dvar
+        realGrowthRate = aux_var.realGrowthRate
+        productivityRate = param.productivityRate
+
+        dvar.wage = aux_var.wageDelta * var.wage
 
-        self.dvar.productivity = self.param.productivityRate * self.var.productivity
+        dvar.productivity = productivityRate * var.productivity
 
-        self.dvar.population = self.param.birthRate * self.var.population
+        dvar.population = param.birthRate * var.population
 
-        self.dvar.laborFraction = self.var.laborFraction * (
-            self.aux_var.realGrowthRate
-            - self.param.productivityRate
-            - self.param.birthRate
+        dvar.laborFraction = var.laborFraction * (
+            realGrowthRate - productivityRate - param.birthRate
         )
 
-        self.dvar.output = self.var.output * self.aux_var.realGrowthRate
+        dvar.output = var.output * realGrowthRate
 
-        self.dvar.wageShare = self.var.wageShare * (
-            self.aux_var.wageDelta - self.param.productivityRate
-        )
+        dvar.wageShare = var.wageShare * (aux_var.wageDelta - productivityRate)
 
-        self.dvar.debtRatio = (
-            self.aux_var.investDelta
-            - self.aux_var.profitShare
-            - self.var.debtRatio * self.aux_var.realGrowthRate
+        dvar.debtRatio = (
+            aux_var.investDelta - aux_var.profitShare - var.debtRatio * realGrowthRate
         )
 
     def setup_ui(self):
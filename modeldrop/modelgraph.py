@@ -1,10 +1,21 @@
-from .basemodel import float_range
-from .graphing import write_graph
+import numpy
 
+from .graphing import write_graphs
 
-def make_graphs_from_model(model, directory=".", transparent=False):
+
+def make_graphs_from_model(model, directory=".", transparent=False, max_workers=1):
+    """
+    Runs model and writes a .png of each of its plots to directory.
+    max_workers other than 1 renders them in a pool of worker processes,
+    None for one per cpu, which needs the calling script to have an
+    if __name__ == "__main__" guard.
+    """
     model.run()
 
+    # a single array of times is shared by all the datasets,
+    # rather than matplotlib converting the list for each one
+    times = numpy.array(model.times)
+
     graphs = []
     for plot in model.plots:
 
@@ -15,7 +26,7 @@ def make_graphs_from_model(model, directory=".", transparent=False):
             for key in keys:
                 dataset = {
                     "graph_type": "line",
-                    "xvals": model.times,
+                    "xvals": times,
                     "yvals": model.solution[key],
                     "label": key,
                 }
@@ -26,19 +37,23 @@ def make_graphs_from_model(model, directory=".", transparent=False):
 
             fn = plot["fn"]
             basename, xlims = "plot-" + fn, plot["xlims"]
-            d = (xlims[1] - xlims[0]) / 100.0
-            x_vals = list(float_range(xlims[0], xlims[1], d))
+            x_vals = numpy.linspace(xlims[0], xlims[1], 101)
+            try:
+                # most fns are plain arithmetic that also works on arrays
+                y_vals = numpy.broadcast_to(model.fn[fn](x_vals), x_vals.shape)
+            except (TypeError, ValueError):
+                # fns that branch with if or use math only take scalars
+                y_vals = numpy.array([model.fn[fn](x) for x in x_vals])
             graph = {"basename": basename, "is_legend": True, "datasets": []}
             dataset = {
                 "graph_type": "line",
                 "xvals": x_vals,
-                "yvals": [model.fn[fn](x) for x in x_vals],
+                "yvals": y_vals,
                 "label": fn,
             }
             graph["datasets"].append(dataset)
             graphs.append(graph)
 
-    for graph in graphs:
-        write_graph(graph, directory, transparent)
+    write_graphs(graphs, directory, transparent, max_workers=max_workers)
 
     return graphs
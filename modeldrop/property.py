@@ -1,10 +1,16 @@
-import math
+import numpy
 
 from .basemodel import BaseModel
 
 
 def get_min_payment(principal, rate, n_payment):
-    return (rate * principal) / (1.0 - math.pow(1.0 + rate, -n_payment))
+    return (rate * principal) / (1.0 - (1.0 + rate) ** -n_payment)
+
+
+def calc_growth_integral(rate, t):
+    """Returns the integral of exp(rate * s) over s from 0 to t"""
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.where(rate == 0, t, numpy.expm1(rate * t) / rate)
 
 
 class PropertyVsFundInvestmentModel(BaseModel):
@@ -23,6 +29,10 @@ class PropertyVsFundInvestmentModel(BaseModel):
         self.param.inflation = 0.02
         self.param.time = 50
 
+        # the equations are all linear, so are solved in closed form
+        self.integrate_method = "analytic_integrate"
+        self.is_array_aux_vars = True
+
         self.setup_ui()
 
     def init_vars(self):
@@ -64,15 +74,49 @@ class PropertyVsFundInvestmentModel(BaseModel):
     def calc_dvars(self, t):
         self.dvar.totalInterest = self.aux_var.interestPaid
         self.dvar.property = self.param.propertyRate * self.var.property
-        if self.var.principal >= 0:
-            self.dvar.principal = -(self.param.paymentRate - self.aux_var.interestPaid)
-        else:
-            self.dvar.principal = 0
+        # numpy.where rather than if, so that run_sweep can pass arrays
+        self.dvar.principal = numpy.where(
+            self.var.principal >= 0,
+            -(self.param.paymentRate - self.aux_var.interestPaid),
+            0,
+        )
         self.dvar.fund = self.param.fundRate * self.var.fund + self.aux_var.fundChange
         self.dvar.paid = self.param.paymentRate
         self.dvar.rent = self.param.inflation * self.var.rent
         self.dvar.totalRent = self.var.rent
 
+    def analytic_integrate(self):
+        p = self.param
+        v = self.var
+        # with the array params of run_sweep, time runs down the first axis
+        t = numpy.reshape(self.times, (-1,) + (1,) * numpy.ndim(v.principal))
+
+        self.solution.property = v.property * numpy.exp(p.propertyRate * t)
+        self.solution.rent = v.rent * numpy.exp(p.inflation * t)
+        self.solution.totalRent = v.totalRent + v.rent * calc_growth_integral(
+            p.inflation, t
+        )
+        self.solution.paid = v.paid + p.paymentRate * t
+
+        # the principal decays as principal - paymentRate / interestRate
+        # grows with interestRate, until it is paid off and stays at zero
+        excess = p.interestRate * v.principal - p.paymentRate
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            t_paid_off = numpy.log(-p.paymentRate / excess) / p.interestRate
+        t_loan = numpy.where(excess < 0, numpy.minimum(t, t_paid_off), t)
+        interest_integral = excess * calc_growth_integral(p.interestRate, t_loan)
+        self.solution.principal = v.principal + interest_integral
+        self.solution.totalInterest = (
+            v.totalInterest + p.paymentRate * t_loan + interest_integral
+        )
+
+        # the fund grows with fundRate while taking in paymentRate - rent
+        self.solution.fund = numpy.exp(p.fundRate * t) * (
+            v.fund
+            + p.paymentRate * calc_growth_integral(-p.fundRate, t)
+            - v.rent * calc_growth_integral(p.inflation - p.fundRate, t)
+        )
+
     def setup_ui(self):
         self.editable_params = [
             {"key": "time", "max": 100,},
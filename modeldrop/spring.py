@@ -1,5 +1,7 @@
 import math
 
+import numpy
+
 from modeldrop.basemodel import BaseModel
 
 
@@ -11,17 +13,46 @@ class ElasticSpringModel(BaseModel):
         self.param.dt = 0.01
         self.param.initX = 1
         self.param.initV = 0
+        # an undamped spring has an exact solution
+        self.integrate_method = "analytic_integrate"
         self.setup_ui()
 
     def init_vars(self):
         self.var.x = self.param.initX
         self.var.v = self.param.initV
+        # the acceleration per unit of x, which is fixed for a run
+        self.spring_constant = (
+            -4 * math.pi * math.pi / self.param.period / self.param.period
+        )
 
     def calc_dvars(self, t):
         self.dvar.x = self.var.v
-        self.dvar.v = (
-            -4 * math.pi * math.pi / self.param.period / self.param.period * self.var.x
-        )
+        self.dvar.v = self.spring_constant * self.var.x
+
+    def analytic_integrate(self):
+        # with the array params of run_sweep, time runs down the first axis
+        t = numpy.reshape(self.times, (-1,) + (1,) * numpy.ndim(self.var.x))
+        omega = 2 * math.pi / self.param.period
+        cos = numpy.cos(omega * t)
+        sin = numpy.sin(omega * t)
+        self.solution.x = self.var.x * cos + self.var.v / omega * sin
+        self.solution.v = self.var.v * cos - self.var.x * omega * sin
+
+    def leapfrog_integrate(self):
+        # kick-drift-kick steps are symplectic, so unlike euler_integrate
+        # the energy stays bounded and much larger dt can be used
+        half_kick = 0.5 * self.param.dt * self.spring_constant
+        drift = self.param.dt
+        x, v = self.var.x, self.var.v
+        n_time = len(self.times)
+        self.solution.x = numpy.empty((n_time,) + numpy.shape(x))
+        self.solution.v = numpy.empty((n_time,) + numpy.shape(v))
+        for i in range(n_time):
+            self.solution.x[i] = x
+            self.solution.v[i] = v
+            v = v + half_kick * x
+            x = x + drift * v
+            v = v + half_kick * x
 
     def setup_ui(self):
         self.plots = [
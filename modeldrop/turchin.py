@@ -1,3 +1,5 @@
+import numpy
+
 from .basemodel import BaseModel, make_approach_fn
 
 
@@ -15,6 +17,8 @@ class TurchinDemographicStateModel(BaseModel):
         self.param.stateRevenueAtHalfCapacity = 10
         self.param.maxCarryCapacity = 3
 
+        self.is_array_aux_vars = True
+
         self.setup_ui()
 
     def init_vars(self):
@@ -23,25 +27,41 @@ class TurchinDemographicStateModel(BaseModel):
         )
         self.var.populationDensity = 0.2
         self.var.stateRevenue = 0
+        # the rise in carrying capacity that state revenue can buy
+        self.carry_capacity_diff = self.param.maxCarryCapacity - 1
 
     def calc_aux_vars(self):
-        self.aux_var.carryingCapacity = self.fn.carryingCapacityFn(
-            self.var.stateRevenue
+        # carryingCapacityFn inlined, with the revenue clamped at zero,
+        # and kept for its plot; numpy.maximum for the arrays of the
+        # aux var pass and run_sweep, as max is quicker on floats
+        revenue = self.var.stateRevenue
+        if isinstance(revenue, numpy.ndarray):
+            revenue = numpy.maximum(revenue, 0)
+        else:
+            revenue = max(revenue, 0)
+        self.aux_var.carryingCapacity = 1 + self.carry_capacity_diff * (
+            revenue / (self.param.stateRevenueAtHalfCapacity + revenue)
         )
         self.aux_var.surplus = self.param.maxSurplus * (
             1 - self.var.populationDensity / self.aux_var.carryingCapacity
         )
 
     def calc_dvars(self, t):
-        self.dvar.populationDensity = (
-            self.param.growth * self.var.populationDensity * self.aux_var.surplus
-        )
-        self.dvar.stateRevenue = (
-            self.param.taxOnSurplus * self.var.populationDensity * self.aux_var.surplus
-            - self.param.expenditurePerCapita * self.var.populationDensity
+        # the density and surplus just used by calc_aux_vars are read once
+        populationDensity = self.var.populationDensity
+        surplus = self.aux_var.surplus
+
+        self.dvar.populationDensity = self.param.growth * populationDensity * surplus
+        dRevenue = (
+            self.param.taxOnSurplus * populationDensity * surplus
+            - self.param.expenditurePerCapita * populationDensity
         )
-        if self.dvar.stateRevenue + self.var.stateRevenue < 0:
-            self.dvar.stateRevenue = -self.var.stateRevenue
+        # the revenue can't be spent below zero, with numpy.maximum
+        # only for the arrays of run_sweep, as max is quicker on floats
+        if isinstance(dRevenue, numpy.ndarray):
+            self.dvar.stateRevenue = numpy.maximum(dRevenue, -self.var.stateRevenue)
+        else:
+            self.dvar.stateRevenue = max(dRevenue, -self.var.stateRevenue)
 
     def setup_ui(self):
         self.plots = [
@@ -1,6 +1,7 @@
 from modeldrop.growth import FundamentalPopulationModel
 from modeldrop.modelgraph import make_graphs_from_model
 
-model = FundamentalPopulationModel()
+if __name__ == "__main__":
+    model = FundamentalPopulationModel()
 
-make_graphs_from_model(model, "growth_pngs", transparent=True)
+    make_graphs_from_model(model, "growth_pngs", transparent=True)
@@ -0,0 +1,95 @@
+import datetime
+import gzip
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy
+
+from modeldrop import graphing
+
+
+class TestJsonDumps(unittest.TestCase):
+    o = {
+        "x": [0.5, 1, float("nan"), float("inf")],
+        "y": numpy.array([numpy.nan, 1.5, -numpy.inf]),
+        "n": numpy.int64(3),
+        1: "tést",
+        "date": datetime.datetime(2020, 1, 1),
+    }
+
+    def dumps_with_stdlib(self, indent):
+        with mock.patch.object(graphing, "orjson", None):
+            return graphing.json_dumps_bytes(self.o, indent)
+
+    def test_non_finite_as_null(self):
+        for indent in (2, None, 4):
+            txt = self.dumps_with_stdlib(indent).decode()
+            self.assertNotIn("NaN", txt)
+            self.assertNotIn("Infinity", txt)
+            self.assertEqual(txt, graphing.json_dumps(self.o, indent))
+
+    @unittest.skipIf(graphing.orjson is None, "orjson is not installed")
+    def test_same_as_orjson(self):
+        for indent in (2, None):
+            self.assertEqual(
+                graphing.json_dumps_bytes(self.o, indent),
+                self.dumps_with_stdlib(indent),
+            )
+
+
+def make_graphs():
+    x = numpy.linspace(0, 10, 50)
+    graphs = []
+    for i in range(2):
+        datasets = [
+            {"graph_type": "line", "xvals": x, "yvals": numpy.sin(x + i)},
+            {"graph_type": "line", "xvals": x, "yvals": x * i, "label": "b"},
+        ]
+        graph = {"basename": f"graph{i}", "is_legend": True, "datasets": datasets}
+        graphs.append(graph)
+    return graphs
+
+
+def read_files(directory):
+    contents = {}
+    for fname in os.listdir(directory):
+        with open(os.path.join(directory, fname), "rb") as f:
+            contents[fname] = f.read()
+        if fname.endswith(".gz"):
+            # the gzip header holds the time of writing
+            contents[fname] = gzip.decompress(contents[fname])
+    return contents
+
+
+class TestWriteGraphs(unittest.TestCase):
+    def check_serial_and_pool(self, json_compress):
+        json_ext = ".json.gz" if json_compress else ".json"
+        with tempfile.TemporaryDirectory() as directory:
+            contents = []
+            for max_workers in (1, 2):
+                sub_dir = os.path.join(directory, str(max_workers))
+                pngs = graphing.write_graphs(
+                    make_graphs(),
+                    sub_dir,
+                    json_compress=json_compress,
+                    max_workers=max_workers,
+                )
+                self.assertEqual(
+                    pngs, [os.path.join(sub_dir, f"graph{i}.png") for i in range(2)]
+                )
+                contents.append(read_files(sub_dir))
+            fnames = [f"graph{i}{ext}" for i in range(2) for ext in (".png", json_ext)]
+            self.assertEqual(sorted(contents[0]), sorted(fnames))
+            self.assertEqual(contents[0], contents[1])
+
+    def test_json_sidecar(self):
+        self.check_serial_and_pool(json_compress=False)
+
+    def test_json_compress(self):
+        self.check_serial_and_pool(json_compress=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
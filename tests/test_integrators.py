@@ -0,0 +1,93 @@
+import unittest
+
+import numpy
+
+from modeldrop.basemodel import BaseModel
+from modeldrop.epi import StandardThreePartEpidemiologyModel
+from modeldrop.property import PropertyVsFundInvestmentModel
+from modeldrop.spring import ElasticSpringModel
+from modeldrop.turchin import TurchinDemographicStateModel
+
+
+class BlowUpModel(BaseModel):
+    """x' = x^2 from x = 1, which goes to infinity at t = 1"""
+
+    def setup(self):
+        self.param.time = 2
+        self.param.dt = 0.01
+
+    def init_vars(self):
+        self.var.x = 1.0
+
+    def calc_aux_vars(self):
+        self.aux_var.x2 = self.var.x * self.var.x
+
+    def calc_dvars(self, t):
+        self.dvar.x = self.aux_var.x2
+
+
+def run_model(model_class, integrate_method):
+    model = model_class()
+    model.integrate_method = integrate_method
+    model.run()
+    return model
+
+
+class TestIntegrators(unittest.TestCase):
+    def check_against_odeint(self, model_class, integrate_method, tol):
+        # errors are relative to the largest value of each solution, as
+        # solutions that cross zero have no relative error there
+        model = run_model(model_class, integrate_method)
+        ref = run_model(model_class, "scipy_odeint_integrate")
+        numpy.testing.assert_array_equal(model.times, ref.times)
+        for key in ref.solution:
+            scale = numpy.max(numpy.abs(ref.solution[key]))
+            numpy.testing.assert_allclose(
+                model.solution[key], ref.solution[key], rtol=0, atol=tol * scale
+            )
+
+    def test_rk4(self):
+        self.check_against_odeint(
+            StandardThreePartEpidemiologyModel, "rk4_integrate", 1e-6
+        )
+        # the largest dt of the models, where rk4 is still within 0.5%
+        self.check_against_odeint(TurchinDemographicStateModel, "rk4_integrate", 5e-3)
+
+    def test_solve_ivp(self):
+        for model_class in (
+            StandardThreePartEpidemiologyModel,
+            TurchinDemographicStateModel,
+        ):
+            self.check_against_odeint(model_class, "scipy_solve_ivp_integrate", 1e-6)
+
+    def test_property_analytic(self):
+        self.check_against_odeint(
+            PropertyVsFundInvestmentModel, "analytic_integrate", 1e-6
+        )
+
+    def test_spring_analytic(self):
+        self.check_against_odeint(ElasticSpringModel, "analytic_integrate", 1e-6)
+
+    def test_spring_leapfrog(self):
+        # leapfrog is 2nd order, so its phase drifts more than the others
+        self.check_against_odeint(ElasticSpringModel, "leapfrog_integrate", 1e-2)
+
+    def test_break_off_at_non_finite(self):
+        for integrate_method in ("rk4_integrate", "scipy_solve_ivp_integrate"):
+            for is_array_aux_vars in (False, True):
+                model = BlowUpModel()
+                model.integrate_method = integrate_method
+                model.is_array_aux_vars = is_array_aux_vars
+                with numpy.errstate(over="ignore", invalid="ignore"):
+                    model.run()
+                n_time = len(model.times)
+                self.assertLess(n_time, 200)
+                self.assertLess(model.times[-1], 1.1)
+                self.assertEqual(len(model.solution.x), n_time)
+                self.assertEqual(len(model.solution.x2), n_time)
+                # rk4_integrate, like euler_integrate, keeps the row that broke off
+                self.assertTrue(numpy.all(numpy.isfinite(model.solution.x[:-1])))
+
+
+if __name__ == "__main__":
+    unittest.main()
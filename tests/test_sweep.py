@@ -0,0 +1,43 @@
+import unittest
+
+import numpy
+
+from modeldrop.epi import StandardThreePartEpidemiologyModel
+
+
+class TestRunSweep(unittest.TestCase):
+    param_sets = [{"reproductionNumber": 1.5}, {"reproductionNumber": 3}]
+
+    def check_solutions(self, solutions):
+        self.assertEqual(len(solutions), len(self.param_sets))
+        for param_set, solution in zip(self.param_sets, solutions):
+            for value in solution.values():
+                self.assertIsInstance(value, numpy.ndarray)
+            model = StandardThreePartEpidemiologyModel()
+            model.param.update(param_set)
+            model.run()
+            for key in model.keys:
+                numpy.testing.assert_allclose(
+                    solution[key], model.solution[key], rtol=1e-4, atol=1e-3
+                )
+
+    def test_fresh_epi_model(self):
+        # epi calc_dvars loops over self.keys, which run_sweep must set
+        model = StandardThreePartEpidemiologyModel()
+        self.check_solutions(model.run_sweep(self.param_sets))
+
+    def test_fresh_epi_model_in_workers(self):
+        model = StandardThreePartEpidemiologyModel()
+        self.check_solutions(model.run_sweep(self.param_sets, max_workers=2))
+
+    def test_unknown_param_key(self):
+        model = StandardThreePartEpidemiologyModel()
+        with self.assertRaises(ValueError):
+            model.run_sweep([{"reproductionNumber": 2}, {"reproductionNum": 2}])
+
+    def test_no_param_sets(self):
+        self.assertEqual(StandardThreePartEpidemiologyModel().run_sweep([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()